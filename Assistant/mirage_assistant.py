@@ -11,20 +11,26 @@ remove all traces of activity from 'setup' and evidence collection.
 
 import argparse
 import asyncio
+import collections
 import datetime
+import functools
 import json
 import logging
 import os
 import re
+import shlex
 import sys
+import threading
 import time
 import traceback
 import urllib.parse
 
-from google.auth.exceptions import RefreshError
+import google.auth
+from google.auth.credentials import Credentials
+from google.auth.exceptions import GoogleAuthError, RefreshError
 from google.oauth2 import service_account
-from google_auth_httplib2 import Request
-from httplib2 import Http
+from google_auth_httplib2 import AuthorizedHttp, Request
+from httplib2 import Http, HttpLib2Error
 
 # CHANGE ME
 PROJECT_NAME = "sir"  # Name of project created in GCP environment (datetime appended). 1-10 lowercase letters and/or
@@ -37,23 +43,25 @@ TOOL_NAME = "mirage_assistant"
 TOOL_NAME_FRIENDLY = "Mirage Assistant"
 USER_AGENT = f"create_service_account_v{VERSION}"
 PROJECT_NAME_PATT = r'^[a-z0-9]{1,10}$'
+_PROJECT_NAME_RE = re.compile(PROJECT_NAME_PATT)
+_NOW_STR = datetime.datetime.now().strftime('%Y-%m-%d-%H-%M-%S')  # Start time of the script, used in resource names
 
 # Stylistic color constants
 BG = "\u001b[32;1m"  # Bright green
 GD = "\u001b[33;5;220m"  # Gold
 RR = "\u001b[0m"  # Reset
+CLEAR = "\u001b[2J\u001b[H"  # Clear screen and move cursor to the top left corner
 
 # File constants
-RUNNING_DIRECTORY = os.path.realpath(__file__).rpartition('/')[0]
+RUNNING_DIRECTORY = os.path.dirname(os.path.realpath(__file__))
 DEFAULT_OUTPUT_FOLDER = os.path.join(RUNNING_DIRECTORY, 'reference')
 ID_FILE = os.path.join(DEFAULT_OUTPUT_FOLDER, 'project_id')
 ROLE_BINDINGS_FILE = os.path.join(DEFAULT_OUTPUT_FOLDER, 'role_bindings_tracker')
 UNDELETED_ID_FILE = os.path.join(RUNNING_DIRECTORY, 'undeleted_project_id')
 UNDELETED_ROLE_BINDINGS_FILE = os.path.join(RUNNING_DIRECTORY, 'undeleted_role_bindings')
 TROUBLESHOOTING_LOG_FILE = 'mirage_assistant.log'
-TROUBLESHOOTING_LOG_FILE_PATH = os.path.join(RUNNING_DIRECTORY, f'{TROUBLESHOOTING_LOG_FILE}')
-KEY_FILE = os.path.join(RUNNING_DIRECTORY, f"{TOOL_NAME.lower()}-service-account-key-"
-                                           f"{datetime.datetime.now().strftime('%Y-%m-%d-%H-%M-%S')}.json")
+TROUBLESHOOTING_LOG_FILE_PATH = os.path.join(RUNNING_DIRECTORY, TROUBLESHOOTING_LOG_FILE)
+KEY_FILE = os.path.join(RUNNING_DIRECTORY, f"{TOOL_NAME.lower()}-service-account-key-{_NOW_STR}.json")
 
 # API and scope constants
 DWD_URL_FORMAT = ("https://admin.google.com/ac/owl/domainwidedelegation?"
@@ -73,16 +81,128 @@ SCOPES_ALL = ['https://www.googleapis.com/auth/admin.directory.user.readonly',
               'https://www.googleapis.com/auth/admin.reports.audit.readonly',
               'https://www.googleapis.com/auth/admin.reports.usage.readonly',
               'https://www.googleapis.com/auth/gmail.readonly']
+# API id -> (API name, service name, URL template of the request used to check the access to the API)
+_API_PROBES = {
+    # Admin SDK does not have a corresponding service.
+    "admin.googleapis.com": ("Admin SDK", "",
+                             "https://content-admin.googleapis.com/admin/directory/v1/users/{email}?fields=isAdmin"),
+    "calendar-json.googleapis.com": ("Calendar", "Calendar",
+                                     "https://www.googleapis.com/calendar/v3/users/me/calendarList?maxResults=1"
+                                     "&fields=kind"),
+    # Contacts does not have a corresponding service.
+    "contacts.googleapis.com": ("Contacts", "", "https://www.google.com/m8/feeds/contacts/a.com/full/invalid_contact"),
+    "drive.googleapis.com": ("Drive", "Drive", "https://www.googleapis.com/drive/v3/files?pageSize=1&fields=kind"),
+    "gmail.googleapis.com": ("Gmail", "Gmail",
+                             "https://gmail.googleapis.com/gmail/v1/users/me/labels?fields=labels.id"),
+    "tasks.googleapis.com": ("Tasks", "Tasks",
+                             "https://tasks.googleapis.com/tasks/v1/users/@me/lists?maxResults=1&fields=kind"),
+    "cloudasset.googleapis.com": ("CloudAsset", "CloudAsset",
+                                  "https://cloudasset.googleapis.com/v1/projects/{project_id}/assets"),
+}
+CLOUD_PLATFORM_SCOPE = 'https://www.googleapis.com/auth/cloud-platform'
+SERVICE_USAGE_URL = "https://serviceusage.googleapis.com/v1"
+# Resource type -> URL template of the resource whose IAM policy holds the role bindings
+_IAM_RESOURCE_URLS = {
+    'project': "https://cloudresourcemanager.googleapis.com/v1/projects/{resource_id}",
+    'folder': "https://cloudresourcemanager.googleapis.com/v2/folders/{resource_id}",
+    'organization': "https://cloudresourcemanager.googleapis.com/v1/organizations/{resource_id}"
+}
 
 # Mapping constants
 SUPPORTED_MODULES = ['logs', 'configurations', 'all']
 PROFILE = ["roles/logging.privateLogViewer", "roles/cloudasset.viewer"]
 
+# Concurrency constants
+MAX_CONCURRENT_REQUESTS = 8  # Upper bound on blocking network calls or subprocesses running at once
+
+# HTTP clients, one per thread (Http is not thread-safe) and created on first use so connections to Google API
+# hosts are kept alive across requests
+_THREAD_LOCAL = threading.local()
+
+# Service account key info and credentials, parsed once from KEY_FILE, and delegated access tokens cached per subject
+# and scopes
+TOKEN_EXPIRY_MARGIN = datetime.timedelta(seconds=60)
+_SA_INFO = None
+_BASE_CREDENTIALS = None
+_BASE_CREDENTIALS_LOCK = threading.Lock()
+_TOKEN_CACHE = {}  # (subject, frozenset(scopes)) -> (token, expiry)
+
+# Application default credentials of the Cloud Shell user, used for direct REST calls to Google Cloud APIs
+_ADC_CREDENTIALS = None
+_ADC_CREDENTIALS_LOCK = threading.Lock()
+
+# Tracker of the role bindings recorded in ROLE_BINDINGS_FILE, created on first use
+_ROLE_BINDING_TRACKER = None
+
+# Tasks resolving to the results of lookups that do not change during a run, keyed by the name of the getter
+_MEMO = {}
+
+
+def _get_http() -> Http:
+    """Returns the Http client of the current thread, creating it on first use"""
+    http = getattr(_THREAD_LOCAL, 'http', None)
+    if http is None:
+        http = _THREAD_LOCAL.http = Http()
+    return http
+
+
+def _get_auth_request() -> Request:
+    """Returns the token refresh transport of the current thread, bound to its Http client and created on first
+    use"""
+    request = getattr(_THREAD_LOCAL, 'auth_request', None)
+    if request is None:
+        request = _THREAD_LOCAL.auth_request = Request(_get_http())
+    return request
+
+
+def _get_adc_credentials() -> Credentials:
+    """Returns the application default credentials of the Cloud Shell user, loading them on first use"""
+    global _ADC_CREDENTIALS
+    with _ADC_CREDENTIALS_LOCK:
+        if _ADC_CREDENTIALS is None:
+            _ADC_CREDENTIALS, _ = google.auth.default(scopes=[CLOUD_PLATFORM_SCOPE])
+        return _ADC_CREDENTIALS
+
+
+def _memoize(func):
+    """Decorates a coroutine function without arguments so that it is awaited at most once per run and its result
+    is reused afterwards. The in-flight task is memoized, so concurrent callers share a single execution; a failed
+    execution is forgotten so that the next caller tries again
+
+    @param func: the coroutine function to memoize
+    """
+
+    @functools.wraps(func)
+    async def wrapper():
+        task = _MEMO.get(func.__name__)
+        if task is None:
+            task = _MEMO[func.__name__] = asyncio.ensure_future(func())
+        try:
+            return await task
+        except Exception:
+            if _MEMO.get(func.__name__) is task:
+                del _MEMO[func.__name__]
+            raise
+
+    return wrapper
+
+
+def _set_memo(func, value) -> None:
+    """Records the result of a memoized getter whose value is already known, so that it is never awaited
+
+    @param func: the memoized coroutine function
+    @param value: the result to return from func
+    """
+
+    future = asyncio.get_running_loop().create_future()
+    future.set_result(value)
+    _MEMO[func.__name__] = future
+
 
 def change_me_section_check() -> None:
     """Validates the project name in the "change me" section that the user might change. 
     If the validation fails, the script exists with error code 1"""
-    if not re.match(PROJECT_NAME_PATT, PROJECT_NAME):
+    if not _PROJECT_NAME_RE.match(PROJECT_NAME):
         logging.critical("project name must be no longer than 10 letters or numbers! Update the \"CHANGE ME\" "
                          "section in the script file and change the \"PROJECT NAME\" accordingly")
         sys.exit(1)
@@ -133,7 +253,7 @@ def validate_arguments(parser: argparse.ArgumentParser, args: argparse.Namespace
             parser.error("specify a single organization ID OR multiple project and folder ID(s)")
 
 
-async def retryable_command(command: str,
+async def retryable_command(command: (str, list),
                             max_num_retries=3,
                             retry_delay=5,
                             suppress_errors=False,
@@ -141,25 +261,34 @@ async def retryable_command(command: str,
     """
     Executes a given command several times with delays and returns the stdout, stderr, and return code
 
-    @param command: the command to execute in Google Cloud Shell
+    @param command: the command to execute in Google Cloud Shell, either as an argument list or as a string that is
+    split like a shell would
     @param max_num_retries: the maximum number of attempts to execute the command
     @param retry_delay: how many seconds to sleep between each attempt
     @param suppress_errors: Whether to supress errors or not
     @param require_output: Whether to return the output of the command or not
     """
 
+    argv = command if isinstance(command, list) else shlex.split(command)
     num_tries = 1
     while num_tries <= max_num_retries:
-        logging.debug("Executing command (attempt %d): %s", num_tries, command)
-        process = await asyncio.create_subprocess_shell(
-            command,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE)
-        stdout, stderr = await process.communicate()
-        return_code = process.returncode
-
-        logging.debug("stdout: %s", stdout.decode())
-        logging.debug("stderr: %s", stderr.decode())
+        logging.debug("Executing command (attempt %d): %s", num_tries, shlex.join(argv))
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *argv,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE)
+            stdout, stderr = await process.communicate()
+            return_code = process.returncode
+        except OSError as e:
+            # A missing or non-executable binary fails like it would in a shell
+            stdout, stderr, return_code = b"", str(e).encode(), 127
+
+        # Decode once per attempt and reuse the text for logging
+        decoded_stdout = stdout.decode(errors="replace")
+        decoded_stderr = stderr.decode(errors="replace")
+        logging.debug("stdout: %s", decoded_stdout)
+        logging.debug("stderr: %s", decoded_stderr)
         logging.debug("Return code: %d", return_code)
 
         if return_code == 0:
@@ -172,17 +301,155 @@ async def retryable_command(command: str,
         elif suppress_errors:
             return stdout, stderr, return_code
         else:
-            logging.critical("Failed to execute command: `%s`", stderr.decode())
+            logging.critical("Failed to execute command: `%s`", decoded_stderr)
             sys.exit(return_code)
 
 
+async def retryable_request(method: str,
+                            url: str,
+                            body: dict = None,
+                            max_num_retries=3,
+                            retry_delay=5,
+                            suppress_errors=False,
+                            quota_project_id: str = None) -> (int, dict):
+    """
+    Executes a REST request on behalf of the Cloud Shell user several times with delays and returns the HTTP status
+    and the parsed response. Transport and authentication errors count as failed attempts, reported with status 0
+
+    @param method: the HTTP method of the request (e.g., POST)
+    @param url: the URL matching the relevant API request
+    @param body: the JSON body of the request, if any
+    @param max_num_retries: the maximum number of attempts to execute the request
+    @param retry_delay: how many seconds to sleep between each attempt
+    @param suppress_errors: Whether to supress errors or not
+    @param quota_project_id: the project to bill the request's quota to, required by APIs such as Service Usage
+    that reject user credentials without one
+    """
+
+    num_tries = 1
+    while num_tries <= max_num_retries:
+        logging.debug("Executing %s request (attempt %d): %s", method, num_tries, url)
+        try:
+            status, content = await _run_blocking(_execute_rest_request, method, url, body, quota_project_id)
+        except (HttpLib2Error, OSError, GoogleAuthError) as e:
+            status, content = 0, {"error": {"message": str(e)}}
+        logging.debug("Status: %d", status)
+        logging.debug("Response: %s", content)
+
+        if not _is_request_failure(status):
+            return status, content
+
+        if num_tries < max_num_retries:
+            num_tries += 1
+            await asyncio.sleep(retry_delay)
+        elif suppress_errors:
+            return status, content
+        else:
+            logging.critical("Failed to execute request: `%s`", content)
+            sys.exit(1)
+
+
+def _is_request_failure(status: int) -> bool:
+    """Checks if the HTTP status returned by retryable_request reports a failure, including requests that got no
+    response at all (status 0)
+
+    @param status: the HTTP status of the request
+    """
+
+    return status == 0 or status >= 400
+
+
+def _execute_rest_request(method: str, url: str, body: dict = None, quota_project_id: str = None) -> (int, dict):
+    """Executes a single REST request with the application default credentials over the current thread's Http
+    client; returns the HTTP status and the parsed JSON response
+
+    @param method: the HTTP method of the request (e.g., POST)
+    @param url: the URL matching the relevant API request
+    @param body: the JSON body of the request, if any
+    @param quota_project_id: the project to bill the request's quota to, if any
+    """
+
+    http = AuthorizedHttp(_get_adc_credentials(), http=_get_http())
+    headers = {
+        "Content-Type": "application/json",
+        "User-Agent": USER_AGENT
+    }
+    if quota_project_id:
+        headers["X-Goog-User-Project"] = quota_project_id
+    response, content = http.request(url, method, body=json.dumps(body) if body is not None else None,
+                                     headers=headers)
+    try:
+        return response.status, json.loads(content) if content else {}
+    except ValueError:
+        return response.status, {"error": {"message": content.decode(errors="replace")}}
+
+
+async def _run_blocking(func, *args):
+    """Runs a blocking function in the default executor so that it does not stall the event loop
+
+    @param func: the blocking function to run
+    @param args: the positional arguments to pass to func
+    """
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, func, *args)
+
+
+async def _gather_bounded(*aws, limit=MAX_CONCURRENT_REQUESTS, return_exceptions=False) -> list:
+    """Awaits all given awaitables concurrently, with no more than limit of them running at once; returns their
+    results in the same order
+
+    @param aws: the awaitables to run
+    @param limit: the maximum number of awaitables running at once
+    @param return_exceptions: whether exceptions are returned as results instead of being raised
+    """
+
+    semaphore = asyncio.Semaphore(limit)
+
+    async def _bounded(aw):
+        async with semaphore:
+            return await aw
+
+    return await asyncio.gather(*map(_bounded, aws), return_exceptions=return_exceptions)
+
+
+async def _append(path: str, lines: list) -> None:
+    """Appends lines to a file in the default executor so that slow storage does not stall the event loop
+
+    @param path: the path of the file to append to
+    @param lines: the lines to append, without line endings
+    """
+
+    await _run_blocking(_append_lines, path, lines)
+
+
+def _append_lines(path: str, lines: list) -> None:
+    """Appends lines to a file with a single write, so a batch costs one open and one write system call
+
+    @param path: the path of the file to append to
+    @param lines: the lines to append, without line endings
+    """
+
+    with open(path, 'a') as f:
+        f.write("".join(line + "\n" for line in lines))
+
+
+def _read_file(path: str) -> str:
+    """Reads the entire content of a file
+
+    @param path: the path of the file to read
+    """
+
+    with open(path, 'r') as f:
+        return f.read()
+
+
 def create_reference_folder() -> None:
     """Creates folder for reference file output if it does not already exist"""
     try:
         os.makedirs(DEFAULT_OUTPUT_FOLDER, exist_ok=True)
     except Exception as e:
-        logging.info(f"Cannot create reference folder [{DEFAULT_OUTPUT_FOLDER}] due "
-                     f"to the following error: {str(e)}")
+        logging.info("Cannot create reference folder [%s] due to the following error: %s", DEFAULT_OUTPUT_FOLDER, e)
 
 
 async def _check_project_creation() -> None:
@@ -198,40 +465,42 @@ async def _check_project_creation() -> None:
         if gcp_user_response.lower() == "n":
             sys.exit(0)
         else:
-            os.remove(f"{ID_FILE}")
+            await _run_blocking(os.remove, ID_FILE)
+            check_project_requirements.cache_clear()
 
 
 async def create_project() -> None:
     """Creates a new project in GCP"""
-    logging.info(f"Creating project...")
+    logging.info("Creating project...")
     project_id = f"{PROJECT_NAME.lower()}-{int(time.time() * 1000)}"
-    project_name = f"{PROJECT_NAME.lower()}-{datetime.datetime.now().strftime('%Y-%m-%d-%H-%M-%S')}"
-    await retryable_command(f"gcloud projects create {project_id} "
-                            f"--name {project_name} --set-as-default")
-    with open(ID_FILE, 'a') as f:
-        f.write(project_id + "\n")
-    logging.info(f"Project [{project_id}] created successfully \u2705")
+    project_name = f"{PROJECT_NAME.lower()}-{_NOW_STR}"
+    await retryable_command(["gcloud", "projects", "create", project_id,
+                             "--name", project_name, "--set-as-default"])
+    await _append(ID_FILE, [project_id])
+    check_project_requirements.cache_clear()
+    # The project was set as the gcloud default project, so there is no need to query gcloud for it later
+    _set_memo(_get_project_id, project_id)
+    logging.info("Project [%s] created successfully \u2705", project_id)
 
 
 async def verify_tos_accepted() -> None:
     """Checks for the first API if it can be enabled and enables it.
     If it can't be done, the user is requested to accept the Terms of service"""
-    logging.info(f"Verifying acceptance of Terms of service...")
+    logging.info("Verifying acceptance of Terms of service...")
     tos_accepted = False
     while not tos_accepted:
-        command = f"gcloud services enable {GOOGLE_CLOUD_APIS[0]}"
+        command = ["gcloud", "services", "enable", GOOGLE_CLOUD_APIS[0]]
         _, stderr, return_code = await retryable_command(
             command, max_num_retries=1, suppress_errors=True)
         if return_code:
-            err_str = stderr.decode()
-            if "UREQ_TOS_NOT_ACCEPTED" in err_str:
-                if "universal" in err_str:
+            if b"UREQ_TOS_NOT_ACCEPTED" in stderr:
+                if b"universal" in stderr:
                     logging.debug("Google APIs Terms of Service not accepted")
                     print(f"You must first accept the Google APIs Terms of Service. You "
                           "can accept the terms of service by clicking "
                           "https://console.developers.google.com/terms/universal and "
                           "clicking 'Accept'.\n")
-                elif "appsadmin" in err_str:
+                elif b"appsadmin" in stderr:
                     logging.debug("Google Apps Admin APIs Terms of Service not accepted")
                     print(f"You must first accept the Google Apps Admin APIs Terms of "
                           "Service. You can accept the terms of service by clicking "
@@ -242,29 +511,28 @@ async def verify_tos_accepted() -> None:
                 if answer.lower() == "n":
                     sys.exit(0)
             else:
-                logging.critical(err_str)
+                logging.critical(stderr.decode(errors="replace"))
                 sys.exit(1)
         else:
             tos_accepted = True
-    logging.info(f"Terms of service acceptance verified \u2705")
+    logging.info("Terms of service acceptance verified \u2705")
 
 
 async def verify_service_account_authorization() -> None:
     """Verifies all scopes are authorized. """
-    logging.info(f"Verifying service account authorization...")
+    logging.info("Verifying service account authorization...")
     admin_user_email = await _get_admin_user_email()
     service_account_id = await _get_service_account_id()
     scopes_are_authorized = False
     while not scopes_are_authorized:
-        scope_authorization_failures = []
-        for scope in SCOPES_ALL:
-            scope_authorized = _verify_scope_authorization(admin_user_email, scope)
-            if not scope_authorized:
-                scope_authorization_failures.append(scope)
+        scopes_authorized = await _gather_bounded(
+            *(_run_blocking(_verify_scope_authorization, admin_user_email, scope) for scope in SCOPES_ALL))
+        scope_authorization_failures = [scope for scope, scope_authorized in zip(SCOPES_ALL, scopes_authorized)
+                                        if not scope_authorized]
         if scope_authorization_failures:
             scopes = urllib.parse.quote(",".join(SCOPES_ALL), safe="")
             authorize_url = DWD_URL_FORMAT.format(service_account_id, scopes)
-            logging.info(f"The service account is not properly authorized.")
+            logging.info("The service account is not properly authorized.")
             logging.warning("The following scopes are missing:")
             for scope in scope_authorization_failures:
                 logging.warning("\t- %s", scope)
@@ -277,25 +545,27 @@ async def verify_service_account_authorization() -> None:
             print(f"\n{authorize_url}\n")
             answer = input("Press Enter to try again, 'c' to continue, or 'n' to "
                            "cancel:")
-            if answer.lower == "c":
+            if answer.lower() == "c":
                 scopes_are_authorized = True
             if answer.lower() == "n":
                 sys.exit(0)
         else:
             scopes_are_authorized = True
-    logging.info(f"Service account successfully authorized \u2705")
+    logging.info("Service account successfully authorized \u2705")
 
 
+@_memoize
 async def _get_project_id() -> str:
     """Gets a project id"""
-    command = "gcloud config get-value project"
+    command = ["gcloud", "config", "get-value", "project"]
     project_id, _, _ = await retryable_command(command, require_output=True)
     return project_id.decode().rstrip()
 
 
+@_memoize
 async def _get_admin_user_email() -> str:
     """Gets the gcloud admin account email"""
-    command = 'gcloud auth list --format="value(account)"'
+    command = ["gcloud", "auth", "list", "--format=value(account)"]
     admin_user_email, _, _ = await retryable_command(command, require_output=True)
     return admin_user_email.decode().rstrip()
 
@@ -324,7 +594,7 @@ def _verify_scope_authorization(subject: str, scope: str) -> bool:
     except RefreshError:
         return False
     except Exception as e:
-        logging.error(f"An unknown error occurred: {str(e)}")
+        logging.error("An unknown error occurred: %s", e)
         return False
 
 
@@ -336,99 +606,130 @@ def _get_access_token_for_scopes(subject: str, scopes: list):
 
     """
 
-    logging.debug(f"Getting access token for scopes {scopes}, user {subject} ...")
-    credentials = service_account.Credentials.from_service_account_file(KEY_FILE, scopes=scopes)
-    delegated_credentials = credentials.with_subject(subject)
-    request = Request(Http())
-    delegated_credentials.refresh(request)
-    logging.debug(f"Access token obtained successfully \u2705")
+    cache_key = (subject, frozenset(scopes))
+    cached_token = _TOKEN_CACHE.get(cache_key)
+    if cached_token:
+        token, expiry = cached_token
+        # google-auth keeps expiry as a naive UTC datetime
+        now = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+        if expiry is not None and expiry - now > TOKEN_EXPIRY_MARGIN:
+            logging.debug("Using cached access token for scopes %s, user %s", scopes, subject)
+            return token
+    logging.debug("Getting access token for scopes %s, user %s ...", scopes, subject)
+    delegated_credentials = _get_base_credentials().with_scopes(scopes).with_subject(subject)
+    delegated_credentials.refresh(_get_auth_request())
+    _TOKEN_CACHE[cache_key] = (delegated_credentials.token, delegated_credentials.expiry)
+    logging.debug("Access token obtained successfully \u2705")
     return delegated_credentials.token
 
 
+def _get_base_credentials() -> service_account.Credentials:
+    """Returns the service account credentials from KEY_FILE, loading them on first use. Credentials for specific
+    scopes and subjects are derived from them with with_scopes/with_subject, which reuse the parsed private key"""
+    global _SA_INFO, _BASE_CREDENTIALS
+    with _BASE_CREDENTIALS_LOCK:
+        if _BASE_CREDENTIALS is None:
+            with open(KEY_FILE, 'r') as f:
+                _SA_INFO = json.load(f)
+            _BASE_CREDENTIALS = service_account.Credentials.from_service_account_info(_SA_INFO)
+        return _BASE_CREDENTIALS
+
+
+@_memoize
+async def _get_service_account() -> (str, str):
+    """Gets the service account id and email with a single gcloud call; this function can be executed only after
+    a project is set in gcloud"""
+    command = ["gcloud", "iam", "service-accounts", "list", "--format=value(uniqueId,email)"]
+    output, _, _ = await retryable_command(command, require_output=True)
+    fields = output.decode().splitlines()[0].split('\t')
+    if len(fields) != 2:
+        logging.critical("Unexpected service account listing: `%s`", output.decode(errors="replace"))
+        sys.exit(1)
+    service_account_id, service_account_email = fields
+    return service_account_id, service_account_email
+
+
 async def _get_service_account_id() -> str:
     """Gets the service account id; this function can be executed only after a project is set in gcloud"""
-    command = 'gcloud iam service-accounts list --format="value(uniqueId)"'
-    service_account_id, _, _ = await retryable_command(
-        command, require_output=True)
-    return service_account_id.decode().rstrip()
+    service_account_id, _ = await _get_service_account()
+    return service_account_id
 
 
 async def create_service_account() -> None:
     """Creates the service account"""
-    logging.info(f"Creating service account ...")
+    logging.info("Creating service account ...")
     service_account_name = f"{SERVICE_ACCT_NAME}"
-    await retryable_command(f"gcloud iam service-accounts create {service_account_name}")
+    await retryable_command(["gcloud", "iam", "service-accounts", "create", service_account_name])
     service_account_email = await _get_service_account_email()
-    logging.info(f"Service account [{service_account_email}] created successfully \u2705")
+    logging.info("Service account [%s] created successfully \u2705", service_account_email)
 
 
-async def _enable_api(api) -> None:
-    """Enables a single API that is passed to the function
+async def _wait_for_service_usage_operation(operation: dict,
+                                            project_id: str,
+                                            max_num_polls=150,
+                                            poll_delay=2) -> None:
+    """Polls a Service Usage long-running operation until it is done
 
-    @param api: the Google API to enable
+    @param operation: the operation returned by the Service Usage API
+    @param project_id: the project to bill the polling requests' quota to
+    @param max_num_polls: the maximum number of times to poll the operation before giving up
+    @param poll_delay: how many seconds to sleep between each poll
     """
 
-    command = f"gcloud services enable {api}"
-    await retryable_command(command)
+    num_polls = 0
+    while not operation.get("done"):
+        if "name" not in operation:
+            logging.critical("Unexpected Service Usage response: `%s`", operation)
+            sys.exit(1)
+        if num_polls >= max_num_polls:
+            logging.critical("Service Usage operation [%s] did not complete after %d polls",
+                             operation["name"], max_num_polls)
+            sys.exit(1)
+        num_polls += 1
+        await asyncio.sleep(poll_delay)
+        _, operation = await retryable_request("GET", f"{SERVICE_USAGE_URL}/{operation['name']}",
+                                               quota_project_id=project_id)
+    if "error" in operation:
+        logging.critical("Service Usage operation failed: `%s`", operation["error"])
+        sys.exit(1)
 
 
 async def enable_apis() -> None:
     """Enables APIs in preparation for evidence collection from GW/CI and GCP"""
-    logging.info(f"Enabling APIs ...")
+    logging.info("Enabling APIs ...")
+    project_id = await _get_project_id()
     # verify_tos_accepted checks the first API, so skip it here.
-    enable_api_calls = map(_enable_api, GOOGLE_CLOUD_APIS[1:])
-    await asyncio.gather(*enable_api_calls)
-    logging.info(f"APIs enabled successfully \u2705")
+    _, operation = await retryable_request("POST", f"{SERVICE_USAGE_URL}/projects/{project_id}/services:batchEnable",
+                                           {"serviceIds": GOOGLE_CLOUD_APIS[1:]}, quota_project_id=project_id)
+    await _wait_for_service_usage_operation(operation, project_id)
+    logging.info("APIs enabled successfully \u2705")
 
 
 async def verify_api_access() -> None:
     """Verifies all APIs are accessible"""
-    logging.info(f"Verifying API access...")
+    logging.info("Verifying API access...")
     admin_user_email = await _get_admin_user_email()
     project_id = await _get_project_id()
-    token = _get_access_token_for_scopes(admin_user_email, SCOPES_ALL)
+    # Long-lived delegated credentials, refreshed once here and afterwards only when the token expires. A failed
+    # refresh (e.g., scopes still unauthorized) makes every probe fail, which is reported below as disabled APIs
+    credentials = _get_base_credentials().with_scopes(SCOPES_ALL).with_subject(admin_user_email)
+    await _run_blocking(_refresh_credentials, credentials)
+    probes = []
+    for api in GOOGLE_CLOUD_APIS:
+        probe = _API_PROBES.get(api)
+        if not probe:  # Skip APIs with no known access check
+            continue
+        api_name, service_name, url_template = probe
+        probes.append((api, api_name, service_name,
+                       url_template.format(email=admin_user_email, project_id=project_id)))
     retry_api_verification = True
     while retry_api_verification:
         disabled_apis = {}
         disabled_services = []
         retry_api_verification = False
-        for api in GOOGLE_CLOUD_APIS:
-            api_name = service_name = ""
-            raw_api_response = ""
-            if api == "admin.googleapis.com":
-                # Admin SDK does not have a corresponding service.
-                api_name = "Admin SDK"
-                raw_api_response = execute_api_request(
-                    f"https://content-admin.googleapis.com/admin/directory/v1/users/{admin_user_email}?fields=isAdmin",
-                    token)
-            if api == "calendar-json.googleapis.com":
-                api_name = service_name = "Calendar"
-                raw_api_response = execute_api_request(
-                    "https://www.googleapis.com/calendar/v3/users/me/calendarList?maxResults=1&fields=kind",
-                    token)
-            if api == "contacts.googleapis.com":
-                # Contacts does not have a corresponding service.
-                api_name = "Contacts"
-                raw_api_response = execute_api_request(
-                    "https://www.google.com/m8/feeds/contacts/a.com/full/invalid_contact",
-                    token)
-            if api == "drive.googleapis.com":
-                api_name = service_name = "Drive"
-                raw_api_response = execute_api_request(
-                    "https://www.googleapis.com/drive/v3/files?pageSize=1&fields=kind", token)
-            if api == "gmail.googleapis.com":
-                api_name = service_name = "Gmail"
-                raw_api_response = execute_api_request(
-                    "https://gmail.googleapis.com/gmail/v1/users/me/labels?fields=labels.id", token)
-            if api == "tasks.googleapis.com":
-                api_name = service_name = "Tasks"
-                raw_api_response = execute_api_request(
-                    "https://tasks.googleapis.com/tasks/v1/users/@me/lists?maxResults=1&fields=kind", token)
-            if api == "cloudasset.googleapis.com":
-                api_name = service_name = "CloudAsset"
-                raw_api_response = execute_api_request(
-                    f"https://cloudasset.googleapis.com/v1/projects/{project_id}/assets", token)
-
+        raw_api_responses = await _gather_bounded(
+            *(_run_blocking(execute_api_request, url, credentials) for _, _, _, url in probes))
+        for (api, api_name, service_name, _), raw_api_response in zip(probes, raw_api_responses):
             if _is_api_disabled(raw_api_response):
                 disabled_apis[api_name] = api
                 retry_api_verification = True
@@ -466,7 +767,21 @@ async def verify_api_access() -> None:
             if answer.lower() == "n":
                 sys.exit(0)
 
-    logging.info(f"API access verified \u2705")
+    logging.info("API access verified \u2705")
+
+
+def _refresh_credentials(credentials: Credentials) -> bool:
+    """Refreshes credentials over the current thread's Http client; returns whether the refresh succeeded
+
+    @param credentials: the OAuth2 credentials
+    """
+
+    try:
+        credentials.refresh(_get_auth_request())
+        return True
+    except RefreshError as e:
+        logging.debug("Failed to refresh credentials: %s", e)
+        return False
 
 
 def _is_api_disabled(raw_api_response: str) -> bool:
@@ -482,7 +797,7 @@ def _is_api_disabled(raw_api_response: str) -> bool:
         if "error" in api_response:
             return "it is disabled" in api_response["error"]["message"]
     except Exception as e:
-        logging.error(f'general exception in API disable state check: {str(e)}. Raw response: {raw_api_response}')
+        logging.error("general exception in API disable state check: %s. Raw response: %s", e, raw_api_response)
         pass
     return False
 
@@ -497,15 +812,18 @@ def _is_service_disabled(raw_api_response: str) -> bool:
         return True
     try:
         api_response = json.loads(raw_api_response)
+    except Exception:
+        return False
+
+    try:
         if "error" in api_response and "errors" in api_response["error"]:
             error_reason = api_response["error"]["errors"][0]["reason"]
-            if "notACalendarUser" or "notFound" or "authError" in error_reason:
+            if any(reason in error_reason for reason in ("notACalendarUser", "notFound", "authError")):
                 return True
     except:
         pass
 
     try:
-        api_response = json.loads(raw_api_response)
         if "error" in api_response and "message" in api_response["error"]:
             if "service not enabled" in api_response["error"]["message"]:
                 return True
@@ -515,23 +833,18 @@ def _is_service_disabled(raw_api_response: str) -> bool:
     return False
 
 
-def execute_api_request(url: str, token: str) -> object:
-    """Executes an API request to a given url with a token
+def execute_api_request(url: str, credentials: Credentials) -> object:
+    """Executes an API request to a given url with credentials that are refreshed only when their token expired
 
     @param url: the URL matching the relevant API request
-    @param token: the OAuth2 token
+    @param credentials: the OAuth2 credentials
     @return: Either the str representation of the response or None if the response is empty
     """
 
     try:
-        http = Http()
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json",
-            "User-Agent": USER_AGENT
-        }
+        http = AuthorizedHttp(credentials, http=_get_http())
         logging.debug("Executing API request %s", url)
-        _, content = http.request(url, "GET", headers=headers)
+        _, content = http.request(url, "GET", headers={"User-Agent": USER_AGENT})
         decoded_content = content.decode()
         logging.debug("Response: %s", decoded_content)
         return decoded_content
@@ -543,112 +856,228 @@ def execute_api_request(url: str, token: str) -> object:
 
 async def create_service_account_key() -> None:
     """Creates the key for the service account"""
-    logging.info(f"Creating service account key ...")
+    logging.info("Creating service account key ...")
     service_account_email = await _get_service_account_email()
-    await retryable_command(f"gcloud iam service-accounts keys create {KEY_FILE} "
-                            f"--iam-account={service_account_email}")
-    logging.info(f"Service account key created successfully \u2705")
+    await retryable_command(["gcloud", "iam", "service-accounts", "keys", "create", KEY_FILE,
+                             f"--iam-account={service_account_email}"])
+    logging.info("Service account key created successfully \u2705")
 
 
 async def download_service_account_key() -> None:
     """Downloads the service account key"""
-    command = f"cloudshell download {KEY_FILE}"
+    command = ["cloudshell", "download", KEY_FILE]
     await retryable_command(command)
 
 
 async def delete_key() -> None:
     """Deletes the key from cloud shell after it has been downloaded"""
     input(f"\nPress Enter after you have downloaded the file, as it is about to be shredded.")
-    logging.debug(f"Deleting key file ${KEY_FILE}...")
-    command = f"shred -u {KEY_FILE}"
+    logging.debug("Deleting key file %s...", KEY_FILE)
+    command = ["shred", "-u", KEY_FILE]
     await retryable_command(command)
 
 
 async def _get_service_account_email() -> str:
     """Gets the service account email; this function can be executed only after a project is set in gcloud"""
-    command = 'gcloud iam service-accounts list --format="value(email)"'
-    service_account_email, _, _ = await retryable_command(
-        command, require_output=True)
-    return service_account_email.decode().rstrip()
+    _, service_account_email = await _get_service_account()
+    return service_account_email
 
 
 async def assign_role_binding(project_resource_ids: list = None, folder_resource_ids: list = None,
                               org_resource_id: list = None) -> None:
     """Used to assign IAM role bindings in preparation for GCP forensic collection script functionality.
     The function works independently on each param list, therefore ignored lists should be None.
+    The role bindings of all resources are assigned concurrently.
 
     @param project_resource_ids: a list of the project resource ids
     @param folder_resource_ids: a list of the folder resource ids
     @param org_resource_id: a list of the organization resource ids
     """
     service_account_email = await _get_service_account_email()
-    logging.info(f"Beginning of role binding assignment ...")
-
-    # Role bindings for project(s)
-    if project_resource_ids is not None:
-        for project_id in project_resource_ids:
-            await assign_single_role_binding('project', project_id, service_account_email)
+    logging.info("Beginning of role binding assignment ...")
+
+    # Load role bindings recorded by previous executions before checking them, off the event loop
+    tracker = await _run_blocking(_get_role_binding_tracker)
+
+    # Role bindings for project(s), folder(s) and organization
+    role_bindings = {}  # (resource_type, resource_id) -> roles
+    for resource_type, resource_ids in (('project', project_resource_ids),
+                                        ('folder', folder_resource_ids),
+                                        ('organization', org_resource_id)):
+        for resource_id in resource_ids or []:
+            for role in PROFILE:
+                # Validation and skip action if role binding already exists
+                if role_binding_check(resource_type, resource_id, role, service_account_email):
+                    logging.debug("The '%s' role in the [%s] %s has already been bound to [%s] ... skipping role "
+                                  "binding.", role, resource_id, resource_type, service_account_email)
+                    continue
+                role_bindings.setdefault((resource_type, resource_id), []).append(role)
+
+    results = await _gather_bounded(
+        *(assign_single_role_binding(resource_type, resource_id, roles, service_account_email)
+          for (resource_type, resource_id), roles in role_bindings.items()),
+        return_exceptions=True)
+
+    missing_resource_ids = []
+    failed_resource_ids = []
+    tracked_role_bindings = []
+    for ((resource_type, resource_id), roles), result in zip(role_bindings.items(), results):
+        if isinstance(result, LookupError):
+            missing_resource_ids.append(resource_id)
+        elif isinstance(result, Exception):
+            failed_resource_ids.append(resource_id)
+            logging.info("Role binding assignment to resource [%s] failed \u274c", resource_id)
+            logging.debug("%s", result)
+        elif not result:
+            failed_resource_ids.append(resource_id)
+            logging.info("Role binding assignment to resource [%s] failed \u274c", resource_id)
+        else:
+            tracked_role_bindings.extend((resource_type, resource_id, role, service_account_email) for role in roles)
 
-    # Role bindings for folder(s)
-    if folder_resource_ids is not None:
-        for folder_id in folder_resource_ids:
-            await assign_single_role_binding('folder', folder_id, service_account_email)
+    # Successful role bindings are logged into ROLE_BINDINGS_FILE for tracking (and deletion), with a single open
+    if tracked_role_bindings:
+        await _run_blocking(tracker.add_all, tracked_role_bindings)
+        check_gcp_requirements.cache_clear()
 
-    # Role bindings for organization
-    if org_resource_id is not None:
-        for org_id in org_resource_id:
-            await assign_single_role_binding('organization', org_id, service_account_email)
+    # Error checking to see if previous resource ID(s) were entered incorrectly
+    if missing_resource_ids:
+        print(f"The specified resource ID(s) do not exist or exist outside the scope of the targeted "
+              f"organization: [{', '.join(missing_resource_ids)}]\n"
+              f"Please re-run the script with the correct resource ID(s).")
+        sys.exit(0)
 
     # Final completion message
-    logging.info(f"End of role binding assignment \u2705")
-    logging.info(f"Role bindings are tracked in [{ROLE_BINDINGS_FILE}]")
+    if failed_resource_ids:
+        logging.info("End of role binding assignment, %d resource(s) failed \u274c: [%s]",
+                     len(failed_resource_ids), ", ".join(failed_resource_ids))
+    else:
+        logging.info("End of role binding assignment \u2705")
+    logging.info("Role bindings are tracked in [%s]", ROLE_BINDINGS_FILE)
 
 
-async def assign_single_role_binding(resource_type, resource_id, service_account_email) -> None:
+async def assign_single_role_binding(resource_type, resource_id, roles, service_account_email) -> bool:
     """
-    Assigns a single role binding to a resource id and an identity entity (service_account_email) based 
-    on its type. The assigned roles are: ["roles/logging.privateLogViewer", "roles/cloudasset.viewer"]
-    
+    Assigns roles to an identity entity (service_account_email) on a single resource based on its type, with a
+    read-modify-write of the resource's IAM policy; returns whether the role bindings were assigned successfully.
+    Raises LookupError if the resource does not exist or exists outside the scope of the client's organization.
+
     @param resource_type: the type of the resource (e.g., organization)
-    @param resource_id: the resource id to associate the role binding with
-    @param service_account_email: the email address to associate the role binding with
+    @param resource_id: the resource id to associate the role bindings with
+    @param roles: the roles to be assigned
+    @param service_account_email: the email address to associate the role bindings with
     """
 
-    gcloud_commands = {
-        'project': f"gcloud projects add-iam-policy-binding {resource_id} "
-                   f"--member=serviceAccount:{service_account_email} --role=",
-        'folder': f"gcloud resource-manager folders add-iam-policy-binding {resource_id} "
-                  f"--member=serviceAccount:{service_account_email} --role=",
-        'organization': f"gcloud organizations add-iam-policy-binding {resource_id} "
-                        f"--member=serviceAccount:{service_account_email} --role="
-    }
-    for role in PROFILE:
-        # Validation and skip action if role binding already exists
-        if os.path.isfile(ROLE_BINDINGS_FILE):
-            if role_binding_check(resource_type, resource_id, role, service_account_email):
-                logging.debug(f"The '{role}' role in the [{resource_id}] project "
-                              f"has already been bound to [{service_account_email}] ... skipping role binding.")
-                continue
-        # Continue with role binding action if not skipped via previous validation
-        logging.info(f"Assigning '{role}' to resource [{resource_id}] ...")
-        command = gcloud_commands[resource_type] + role
-        _, stderr, return_code = await retryable_command(command,
-                                                         max_num_retries=1,
-                                                         suppress_errors=True)
-        # Error checking to see if previous resource ID(s) were entered incorrectly
-        err_str = stderr.decode()
-        if "may not exist" in err_str:
-            logging.debug(f"The specified resource ID does not exist or exists outside the scope "
-                          f"of the client's organization: [{resource_id}]")
-            print(f"The specified resource ID does not exist or exists "
-                  f"outside the scope of the targeted organization: [{resource_id}]\n"
-                  f"Please re-run the script with the correct folder ID.")
-            sys.exit(0)
-        # If role binding succeeds, it is logged into ROLE_BINDINGS_FILE for tracking (and deletion)
-        with open(ROLE_BINDINGS_FILE, 'a') as fh:
-            fh.write(f"{resource_type},{resource_id},{role},{service_account_email}\n")
-        # Final completion message
-        logging.info(f"Role binding successful \u2705")
+    resource_url = _IAM_RESOURCE_URLS[resource_type].format(resource_id=resource_id)
+    member = f"serviceAccount:{service_account_email}"
+    logging.info("Assigning %s to resource [%s] ...", ', '.join(roles), resource_id)
+
+    def add_members(policy: dict) -> None:
+        bindings = policy.setdefault("bindings", [])
+        for role in roles:
+            binding = next((b for b in bindings if b["role"] == role and "condition" not in b), None)
+            if binding is None:
+                bindings.append({"role": role, "members": [member]})
+            elif member not in binding["members"]:
+                binding["members"].append(member)
+
+    try:
+        status, response = await _update_iam_policy(resource_url, add_members)
+    except LookupError:
+        logging.debug("The specified resource ID does not exist or exists outside the scope of the client's "
+                      "organization: [%s]", resource_id)
+        raise LookupError(resource_id)
+    if _is_request_failure(status):
+        logging.debug("%s", response)
+        return False
+    # Final completion message
+    logging.info("Role binding on resource [%s] successful \u2705", resource_id)
+    return True
+
+
+async def _update_iam_policy(resource_url: str, modify, max_num_attempts=5, retry_delay=1) -> (int, dict):
+    """Updates the IAM policy of a resource with a read-modify-write; returns the HTTP status and response of the
+    last request. When the policy changed concurrently (HTTP 409, etag mismatch), the policy is read and modified
+    again, like gcloud does. Raises LookupError if the policy of the resource cannot be read (HTTP 403/404).
+
+    @param resource_url: the URL of the resource in its IAM-enabled API
+    @param modify: a function that modifies the policy dict in place
+    @param max_num_attempts: the maximum number of read-modify-write attempts
+    @param retry_delay: how many seconds to sleep between each attempt
+    """
+
+    num_tries = 1
+    while True:
+        status, policy = await retryable_request("POST", f"{resource_url}:getIamPolicy",
+                                                 {"options": {"requestedPolicyVersion": 3}},
+                                                 max_num_retries=1, suppress_errors=True)
+        if status in (403, 404):
+            raise LookupError(resource_url)
+        if _is_request_failure(status):
+            return status, policy
+
+        modify(policy)
+        status, response = await retryable_request("POST", f"{resource_url}:setIamPolicy", {"policy": policy},
+                                                   max_num_retries=1, suppress_errors=True)
+        if status != 409 or num_tries >= max_num_attempts:
+            return status, response
+        logging.debug("IAM policy of [%s] changed concurrently (attempt %d), retrying", resource_url, num_tries)
+        num_tries += 1
+        await asyncio.sleep(retry_delay)
+
+
+class RoleBindingTracker:
+    """
+    Class RoleBindingTracker keeps the role bindings recorded in a tracker file in memory, so that the file is read
+    once per run and looked up without re-parsing it. Role bindings are appended to the file as they are added.
+    """
+
+    def __init__(self, path: str):
+        """
+        Creates a RoleBindingTracker object, loading the role bindings already recorded in the file if it exists
+        @param path: the path of the tracker file, one comma-separated role binding per line:
+        resource, resource_id, role, service_account_email
+        """
+
+        self.path = path
+        self._role_bindings = {}  # Insertion-ordered set of (resource, resource_id, role, service_account_email)
+        if os.path.isfile(path):
+            with open(path, 'r') as f:
+                self._role_bindings = dict.fromkeys(tuple(line.split(',')) for line in f.read().splitlines())
+
+    def contains(self, resource: str, resource_id: str, role: str, service_account_email: str) -> bool:
+        """
+        Checks if a role binding has been recorded
+        @param resource: the type of the resource (e.g., organization)
+        @param resource_id: the resource id the role binding is associated with
+        @param role: the assigned role
+        @param service_account_email: the email address the role binding is associated with
+        """
+        return (resource, resource_id, role, service_account_email) in self._role_bindings
+
+    def add_all(self, role_bindings: list) -> None:
+        """
+        Records role bindings, appending them to the tracker file with a single write
+        @param role_bindings: a list of (resource, resource_id, role, service_account_email) tuples
+        """
+        _append_lines(self.path, [",".join(role_binding) for role_binding in role_bindings])
+        self._role_bindings.update(dict.fromkeys(role_bindings))
+
+    def all(self) -> list:
+        """Returns all recorded role bindings as comma-separated strings, in the order they were recorded"""
+        return [",".join(role_binding) for role_binding in self._role_bindings]
+
+    def remove(self) -> None:
+        """Deletes the tracker file and forgets all recorded role bindings"""
+        os.remove(self.path)
+        self._role_bindings = {}
+
+
+def _get_role_binding_tracker() -> RoleBindingTracker:
+    """Returns the tracker of ROLE_BINDINGS_FILE, loading the file on first use"""
+    global _ROLE_BINDING_TRACKER
+    if _ROLE_BINDING_TRACKER is None:
+        _ROLE_BINDING_TRACKER = RoleBindingTracker(ROLE_BINDINGS_FILE)
+    return _ROLE_BINDING_TRACKER
 
 
 def role_binding_check(resource: str, resource_id: str, role: str, service_account_email: str) -> bool:
@@ -660,56 +1089,53 @@ def role_binding_check(resource: str, resource_id: str, role: str, service_accou
     @param service_account_email: the email address to associate the role binding with
     """
 
-    role_binding = f"{resource},{resource_id},{role},{service_account_email}"
-    with open(ROLE_BINDINGS_FILE, 'r') as f:
-        return role_binding in f.read()
+    return _get_role_binding_tracker().contains(resource, resource_id, role, service_account_email)
 
 
+@functools.cache
 def check_project_requirements() -> bool:
-    """Check if the 'project_id' file is located in the appropriate location"""
+    """Check if the 'project_id' file is located in the appropriate location. The result is cached until
+    check_project_requirements.cache_clear() is called after the file is created or removed"""
     return os.path.exists(ID_FILE)
 
 
 def read_projects() -> list:
     """Read project ID(s) in preparation for project deletion from cache file"""
-    project_ids = []
     with open(ID_FILE, 'r') as f:
-        for line in f:
-            project_ids.append(line.rstrip())
-    return project_ids
+        return f.read().splitlines()
 
 
 async def delete_projects(project_ids) -> int:
-    """Deletes all project IDs from GCP; returns how many projects were deleted successfully
+    """Deletes all project IDs from GCP concurrently; returns how many projects were deleted successfully
 
     @param project_ids: the project ids to delete
     """
 
-    problematic_ids = []
-    count_deleted = 0
-    for project_id in project_ids:
-        successfully_deleted = await delete_project(project_id)
-        if not successfully_deleted:
-            problematic_ids.append(project_id)
-        else:
-            count_deleted += 1
+    results = await _gather_bounded(*(delete_project(project_id) for project_id in project_ids),
+                                     return_exceptions=True)
+    problematic_ids = [project_id for project_id, deleted in zip(project_ids, results) if deleted is not True]
+    count_deleted = len(project_ids) - len(problematic_ids)
+    await remove_project_tracker()
+    if problematic_ids:
+        await _append(UNDELETED_ID_FILE, problematic_ids)
+        logging.info("%d projects could not be deleted and can be found in the following file: [%s]",
+                     len(problematic_ids), UNDELETED_ID_FILE)
+    return count_deleted
+
+
+async def remove_project_tracker() -> None:
+    """Deletes the project ID(s) tracker file and the reference folder, which is left in place if not empty"""
     try:
-        os.remove(ID_FILE)
+        await _run_blocking(os.remove, ID_FILE)
+        check_project_requirements.cache_clear()
     except Exception as e:
-        logging.info(f"Cannot locate/delete file: [{ID_FILE}] \u274c")
-        logging.debug(f"{str(e)}")
+        logging.info("Cannot locate/delete file: [%s] \u274c", ID_FILE)
+        logging.debug("%s", e)
     try:
-        os.rmdir(DEFAULT_OUTPUT_FOLDER)
+        await _run_blocking(os.rmdir, DEFAULT_OUTPUT_FOLDER)
     except Exception as e:
-        logging.info(f"Cannot locate/delete folder: [{DEFAULT_OUTPUT_FOLDER}] \u274c")
-        logging.debug(f"{str(e)}")
-    for problematic_id in problematic_ids:
-        with open(UNDELETED_ID_FILE, 'a') as f:
-            f.write(problematic_id + "\n")
-    if len(problematic_ids) > 0:
-        logging.info(f"{len(problematic_ids)} projects could not be deleted and can be found in "
-                     f"the following file: [{UNDELETED_ID_FILE}]")
-    return count_deleted
+        logging.info("Cannot locate/delete folder: [%s] \u274c", DEFAULT_OUTPUT_FOLDER)
+        logging.debug("%s", e)
 
 
 async def delete_project(project_id) -> bool:
@@ -718,29 +1144,30 @@ async def delete_project(project_id) -> bool:
     @param project_id: the project id to delete
     """
 
-    logging.info(f"Deleting project [{project_id}] ...")
+    logging.info("Deleting project [%s] ...", project_id)
     try:
-        await retryable_command(f"gcloud projects delete {project_id} -q")
-        logging.info(f"Project deletion successful \u2705")
+        status, response = await retryable_request(
+            "DELETE", f"https://cloudresourcemanager.googleapis.com/v1/projects/{project_id}", suppress_errors=True)
+        if _is_request_failure(status):
+            raise Exception(response)
+        logging.info("Project [%s] deletion successful \u2705", project_id)
         return True
     except Exception as e:
-        logging.info(f"Project deletion failure \u274c")
-        logging.debug(f"{str(e)}")
+        logging.info("Project [%s] deletion failure \u274c", project_id)
+        logging.debug("%s", e)
         return False
 
 
+@functools.cache
 def check_gcp_requirements() -> bool:
-    """Check if the 'role_bindings_tracker' file is located in the appropriate location"""
+    """Check if the 'role_bindings_tracker' file is located in the appropriate location. The result is cached until
+    check_gcp_requirements.cache_clear() is called after the file is created or removed"""
     return os.path.exists(ROLE_BINDINGS_FILE)
 
 
 def read_role_bindings() -> list:
     """Read role bindings in preparation for removal from cache file"""
-    role_bindings = []
-    with open(ROLE_BINDINGS_FILE, 'r') as fh:
-        for line in fh:
-            role_bindings.append(line.rstrip())
-    return role_bindings
+    return _get_role_binding_tracker().all()
 
 
 async def remove_role_bindings(role_bindings: list) -> (int, int):
@@ -751,86 +1178,103 @@ async def remove_role_bindings(role_bindings: list) -> (int, int):
     resource, resource_id, role, service_account_email
     """
 
-    logging.info(f"Beginning of role binding removal ...")
-    problematic_role_bindings = []
-    count_deleted = 0
-    problem_count = 0
+    logging.info("Beginning of role binding removal ...")
 
-    # Remove role bindings
+    # Group role bindings by resource, so each resource's IAM policy is updated once
+    grouped_role_bindings = collections.defaultdict(list)  # (resource, resource_id) -> role bindings
     for role_binding in role_bindings:
-        resource, resource_id, role, service_account_email = role_binding.split(',')
-        successfully_deleted = await remove_role_binding(resource, role, resource_id, service_account_email)
-        if successfully_deleted:
-            count_deleted += 1
-        else:
-            problematic_role_bindings.append(role_binding)
+        resource, resource_id, _, _ = role_binding.split(',')
+        grouped_role_bindings[(resource, resource_id)].append(role_binding)
+
+    # Remove role bindings of all resources concurrently
+    results = await _gather_bounded(
+        *(remove_role_binding(resource, resource_id,
+                              [tuple(role_binding.split(',')[2:]) for role_binding in resource_role_bindings])
+          for (resource, resource_id), resource_role_bindings in grouped_role_bindings.items()),
+        return_exceptions=True)
+    problematic_role_bindings = [role_binding
+                                 for resource_role_bindings, deleted in zip(grouped_role_bindings.values(), results)
+                                 if deleted is not True
+                                 for role_binding in resource_role_bindings]
+    count_deleted = len(role_bindings) - len(problematic_role_bindings)
+    problem_count = len(problematic_role_bindings)
 
     # Delete entire role bindings tracker file
-    try:
-        os.remove(ROLE_BINDINGS_FILE)
-    except Exception as e:
-        logging.debug(f"{str(e)}")
-        logging.info(f"Cannot locate/delete file: [{ROLE_BINDINGS_FILE}] \u274c")
+    await remove_role_binding_tracker()
 
     # Regardless of condition, number of failed role binding deletion attempts is tracked for reporting
-    for problematic_role_binding in problematic_role_bindings:
-        with open(UNDELETED_ROLE_BINDINGS_FILE, 'a') as fh:
-            fh.write(problematic_role_binding + "\n")
-    if len(problematic_role_bindings) > 0:
-        logging.info(f"{len(problematic_role_bindings)} role bindings could not be removed.")
-        logging.info(f"Undeleted role bindings tracked in [{UNDELETED_ROLE_BINDINGS_FILE}]")
+    if problematic_role_bindings:
+        await _append(UNDELETED_ROLE_BINDINGS_FILE, problematic_role_bindings)
+        logging.info("%d role bindings could not be removed.", len(problematic_role_bindings))
+        logging.info("Undeleted role bindings tracked in [%s]", UNDELETED_ROLE_BINDINGS_FILE)
 
     # Return counts for additional tracking
-    logging.info(f"End of role binding removal \u2705")
+    logging.info("End of role binding removal \u2705")
     return count_deleted, problem_count
 
 
-async def remove_role_binding(resource_type, role, resource_id, service_account_email) -> bool:
-    """Removes a single role binding in GCP; returns whether the role binding was deleted successfully.
+async def remove_role_binding_tracker() -> None:
+    """Deletes the role bindings tracker file"""
+    try:
+        await _run_blocking(_get_role_binding_tracker().remove)
+        check_gcp_requirements.cache_clear()
+    except Exception as e:
+        logging.debug("%s", e)
+        logging.info("Cannot locate/delete file: [%s] \u274c", ROLE_BINDINGS_FILE)
+
+
+async def remove_role_binding(resource_type, resource_id, role_members) -> bool:
+    """Removes role bindings from a single resource in GCP, with a read-modify-write of the resource's IAM policy;
+    returns whether the role bindings were deleted successfully.
 
     @param resource_type: the resource type (e.g., organization)
-    @param role: the role to be associated
     @param resource_id: the resource id
-    @param service_account_email: the identity entity email address
+    @param role_members: a list of (role, service_account_email) tuples to remove from the resource
     """
 
-    logging.info(f"Removing '{role}' assigned to service account in {resource_type} [{resource_id}] ...")
-    gcloud_commands = {
-        'project': f"gcloud projects remove-iam-policy-binding {resource_id} "
-                   f"--member=serviceAccount:{service_account_email} --role={role}",
-        'folder': f"gcloud resource-manager folders remove-iam-policy-binding {resource_id} "
-                  f"--member=serviceAccount:{service_account_email} --role={role}",
-        'organization': f"gcloud organizations add-iam-policy-binding {resource_id} "
-                        f"--member=serviceAccount:{service_account_email} --role={role}"
-    }
+    roles = ', '.join(role for role, _ in role_members)
+    logging.info("Removing %s assigned to service account in %s [%s] ...", roles, resource_type, resource_id)
     try:
-        command = gcloud_commands[resource_type]
-        await retryable_command(command, max_num_retries=1)
-        logging.info(f"Role binding removal successful \u2705")
+        resource_url = _IAM_RESOURCE_URLS[resource_type].format(resource_id=resource_id)
+
+        def remove_members(policy: dict) -> None:
+            bindings = policy.get("bindings", [])
+            for role, service_account_email in role_members:
+                member = f"serviceAccount:{service_account_email}"
+                for binding in bindings:
+                    if binding["role"] == role and "condition" not in binding and member in binding["members"]:
+                        binding["members"].remove(member)
+            policy["bindings"] = [binding for binding in bindings if binding["members"]]
+
+        status, response = await _update_iam_policy(resource_url, remove_members)
+        if _is_request_failure(status):
+            raise Exception(response)
+        logging.info("Removal of %s in %s [%s] successful \u2705", roles, resource_type, resource_id)
         return True
     except Exception as e:
-        logging.info(f"Role binding removal failure \u274c")
-        logging.debug(f"{str(e)}")
+        logging.info("Removal of %s in %s [%s] failure \u274c", roles, resource_type, resource_id)
+        logging.debug("%s", e)
         return False
 
 
+@_memoize
 async def get_service_account_id_cleanup() -> str:
-    """Gathers the service account email based on the 'project_id' reference file"""
+    """Gathers the service account id based on the 'project_id' reference file, with a single REST call that is
+    executed at most once per run"""
     # Ensure that 'project_id' file reference is available from executing 'setup' functionality
     try:
-        with open(ID_FILE, 'r') as fh:
-            isolated_project_id = fh.read().rstrip()
+        isolated_project_id = (await _run_blocking(_read_file, ID_FILE)).rstrip()
     except Exception as e:
-        logging.info(f"Ensure the 'project_id' file generated from the initial execution of the "
-                     "setup functionality of the script has been placed into the references directory.")
-        logging.debug(f"{str(e)}")
-    # Set project as isolated project created with setup execution
-    command = f"gcloud config set project {isolated_project_id}"
-    await retryable_command(command, max_num_retries=1, suppress_errors=True)
-    # Obtain service account email from isolated project
-    command = "gcloud iam service-accounts list --format='value(uniqueId)'"
-    service_account_email, _, _ = await retryable_command(command, require_output=True)
-    return service_account_email.decode().rstrip()
+        logging.info("Ensure the 'project_id' file generated from the initial execution of the setup functionality "
+                     "of the script has been placed into the references directory.")
+        logging.debug("%s", e)
+    # Obtain service account id from isolated project created with setup execution
+    _, response = await retryable_request(
+        "GET", f"https://iam.googleapis.com/v1/projects/{isolated_project_id}/serviceAccounts")
+    if not response.get("accounts"):
+        logging.critical("No service account found in project [%s]", isolated_project_id)
+        sys.exit(1)
+    return response["accounts"][0]["uniqueId"]
 
 
 def init_logger(args: argparse.Namespace) -> None:
@@ -889,7 +1333,8 @@ async def start_setup(parser: argparse.ArgumentParser, args: argparse.Namespace)
                     parser.error("you may only specify a single organization ID")
 
         # Console prompt
-        os.system("clear")
+        sys.stdout.write(CLEAR)
+        sys.stdout.flush()
         response = input(
             f"Welcome! This script will create and authorize the "
             "resources necessary for Google Cloud incident response. "
@@ -929,7 +1374,7 @@ async def start_setup(parser: argparse.ArgumentParser, args: argparse.Namespace)
         await download_service_account_key()
         await delete_key()
 
-        logging.info(f"Done \u2705")
+        logging.info("Done \u2705")
         print(f"\nIf you have already downloaded the file, then you may close this "
               "page. Please remember that this file is highly sensitive. Any person "
               "who gains access to the key file will then have full access to all "
@@ -949,7 +1394,8 @@ async def start_cleanup(args):
     @param args: the argparse arguments after being parsed
     """
     try:
-        os.system("clear")
+        sys.stdout.write(CLEAR)
+        sys.stdout.flush()
         response = input(
             f"Welcome! This script will delete the GCP project and role bindings that "
             f"were created during the setup script functionality.\n"
@@ -976,12 +1422,18 @@ async def start_cleanup(args):
                 sys.exit(1)
 
             # Deletion of role bindings
-            role_bindings = read_role_bindings()
-            await remove_role_bindings(role_bindings)
+            role_bindings = await _run_blocking(read_role_bindings)
+            if role_bindings:
+                await remove_role_bindings(role_bindings)
+            else:
+                await remove_role_binding_tracker()
 
         # Deletion of projects
-        project_ids = read_projects()
-        await delete_projects(project_ids)
+        project_ids = await _run_blocking(read_projects)
+        if project_ids:
+            await delete_projects(project_ids)
+        else:
+            await remove_project_tracker()
 
     # General exception catcher
     except (Exception, SystemExit) as e: